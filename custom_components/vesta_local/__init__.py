@@ -11,6 +11,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import ConfigEntryAuthFailed, ConfigEntryNotReady
+from homeassistant.helpers.httpx_client import get_async_client
 
 from .client import (
     VestaAuthenticationError,
@@ -22,11 +23,11 @@ from .coordinator import VestaDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-PLATFORMS: list[Platform] = [
+PLATFORMS: tuple[Platform, ...] = (
     Platform.ALARM_CONTROL_PANEL,
     Platform.BINARY_SENSOR,
     Platform.SENSOR,
-]
+)
 
 type VestaConfigEntry = ConfigEntry[VestaDataUpdateCoordinator]
 
@@ -52,13 +53,15 @@ async def async_setup_entry(hass: HomeAssistant, entry: VestaConfigEntry) -> boo
 
     _LOGGER.debug("Setting up Vesta Local integration for %s (SSL: %s)", host, use_ssl)
 
-    # Create the API client
+    # Create the API client, reusing Home Assistant's shared httpx client
+    # so connection pooling and keep-alive are shared across integrations
     client = VestaLocalClient(
         host=host,
         username=username,
         password=password,
         verify_ssl=False,
         use_ssl=use_ssl,
+        client=get_async_client(hass, verify_ssl=False),
     )
 
     # Test the connection
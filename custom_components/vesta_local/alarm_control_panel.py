@@ -15,8 +15,6 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from .const import (
     ALARM_MODE_TO_STATE,
     ALARM_STATE_TO_MODE,
-    CID_DISARM_EVENTS,
-    CID_TRIGGER_EVENTS,
     DOMAIN,
 )
 from .entity import VestaPanelEntity
@@ -67,6 +65,13 @@ class VestaAlarmControlPanel(VestaPanelEntity, AlarmControlPanelEntity):
     _attr_code_arm_required = False
     _attr_code_disarm_required = False
 
+    # Panel mode integers resolved once at class creation so the command
+    # handlers skip the dict lookup on every user action
+    _MODE_DISARM = ALARM_STATE_TO_MODE["disarm"]
+    _MODE_ARM_HOME = ALARM_STATE_TO_MODE["arm_home"]
+    _MODE_ARM_AWAY = ALARM_STATE_TO_MODE["arm_away"]
+    _MODE_ARM_NIGHT = ALARM_STATE_TO_MODE["arm_night"]
+
     def __init__(
         self,
         coordinator: VestaDataUpdateCoordinator,
@@ -83,102 +88,107 @@ class VestaAlarmControlPanel(VestaPanelEntity, AlarmControlPanelEntity):
         super().__init__(coordinator, entry_id, area)
 
         # Override unique ID for alarm panel
-        self._attr_unique_id = f"{entry_id}_alarm_area_{area}"
+        self._attr_unique_id = entry_id + "_alarm_area_" + str(area)
+
+        # Cache of the last computed state, keyed on (mode, latest uid)
+        self._cached_key: tuple[str, int | None] | None = None
+        self._cached_state: AlarmControlPanelState | None = None
+        self._cached_available: bool | None = None
+
+    def _state_key(self) -> tuple[str, int | None] | None:
+        """Return the cache key describing the current panel state.
+
+        Returns:
+            Tuple of (panel mode, latest reported event uid) or None if
+            no coordinator data is available.
+        """
+        data = self.coordinator.data
+        if data is None:
+            return None
+        events = data.reported_events
+        return (data.panel.mode, events[0].uid if events else None)
 
     @property
     def alarm_state(self) -> AlarmControlPanelState | None:
         """Return the current alarm state.
 
         Checks reported events first to detect TRIGGERED state, then falls
-        back to the standard panel mode.
+        back to the standard panel mode. The result is memoized on the
+        (mode, latest event uid) pair so repeated reads between coordinator
+        updates skip the triggered-state scan and dict lookup.
 
         Returns:
             The current AlarmControlPanelState or None if unknown.
         """
-        if self.coordinator.data is None:
+        key = self._state_key()
+        if key is None:
             return None
 
+        if key == self._cached_key:
+            return self._cached_state
+
         # Check reported events for triggered state
         if self._is_triggered():
-            return AlarmControlPanelState.TRIGGERED
-
-        mode = self.coordinator.data.panel.mode
-        state = ALARM_MODE_TO_STATE.get(mode)
+            state: AlarmControlPanelState | None = AlarmControlPanelState.TRIGGERED
+        else:
+            mode = key[0]
+            state = ALARM_MODE_TO_STATE.get(mode.casefold())
+            if state is None:
+                _LOGGER.warning("Unknown alarm mode: %s", mode)
+
+        self._cached_key = key
+        self._cached_state = state
+        return state
 
-        if state is None:
-            _LOGGER.warning("Unknown alarm mode: %s", mode)
-            return None
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator.
 
-        return state
+        Only writes state when availability or the (mode, latest event uid)
+        pair actually changed, avoiding redundant state fan-out on idle polls.
+        """
+        available = self.available
+        if available == self._cached_available and self._state_key() == self._cached_key:
+            return
+        self._cached_available = available
+        super()._handle_coordinator_update()
 
     def _is_triggered(self) -> bool:
         """Check if alarm is in triggered state based on reported events.
 
-        The alarm is triggered if the most recent event (highest UID) has
-        new_event == "Trigger" and cid_event in CID_TRIGGER_EVENTS.
-
-        The triggered state is reset if the most recent event is:
-        - A disarm event (cid_event in CID_DISARM_EVENTS)
-        - A restore event (new_event == "Restore")
+        The flag is computed once per refresh by the coordinator from the
+        reported events, so this is a plain attribute read.
 
         Returns:
             True if the alarm is currently triggered, False otherwise.
         """
-        if self.coordinator.data is None:
-            return False
-
-        reported_events = self.coordinator.data.reported_events
-        if not reported_events:
-            return False
-
-        # Events are sorted by uid descending, so first event is most recent
-        latest_event = reported_events[0]
+        return self.coordinator.is_alarm_triggered
 
-        # Check if latest event is a trigger event
-        if (
-            latest_event.new_event == "Trigger"
-            and latest_event.cid_event in CID_TRIGGER_EVENTS
-        ):
-            return True
+    async def _send(self, mode: int, action: str) -> None:
+        """Log and dispatch a mode-change command.
 
-        return False
-
-    async def async_alarm_disarm(self, code: str | None = None) -> None:
-        """Send disarm command.
+        Shared by the four public command handlers so there is a single
+        copy of the logging and dispatch code. Duplicate in-flight
+        commands are coalesced by the coordinator.
 
         Args:
-            code: The disarm code (not used for local API).
+            mode: The panel mode integer to set.
+            action: Human-readable description for the log line.
         """
-        _LOGGER.info("Disarming alarm (area %d)", self._area)
-        mode = ALARM_STATE_TO_MODE["disarm"]
+        _LOGGER.info("%s (area %d)", action, self._area)
         await self.coordinator.async_set_alarm_mode(mode, self._area)
 
-    async def async_alarm_arm_home(self, code: str | None = None) -> None:
-        """Send arm home command.
+    async def async_alarm_disarm(self, code: str | None = None) -> None:
+        """Send disarm command. The code is not used for the local API."""
+        await self._send(self._MODE_DISARM, "Disarming alarm")
 
-        Args:
-            code: The arm code (not used for local API).
-        """
-        _LOGGER.info("Arming alarm in home mode (area %d)", self._area)
-        mode = ALARM_STATE_TO_MODE["arm_home"]
-        await self.coordinator.async_set_alarm_mode(mode, self._area)
+    async def async_alarm_arm_home(self, code: str | None = None) -> None:
+        """Send arm home command. The code is not used for the local API."""
+        await self._send(self._MODE_ARM_HOME, "Arming alarm in home mode")
 
     async def async_alarm_arm_away(self, code: str | None = None) -> None:
-        """Send arm away command.
-
-        Args:
-            code: The arm code (not used for local API).
-        """
-        _LOGGER.info("Arming alarm in away mode (area %d)", self._area)
-        mode = ALARM_STATE_TO_MODE["arm_away"]
-        await self.coordinator.async_set_alarm_mode(mode, self._area)
+        """Send arm away command. The code is not used for the local API."""
+        await self._send(self._MODE_ARM_AWAY, "Arming alarm in away mode")
 
     async def async_alarm_arm_night(self, code: str | None = None) -> None:
-        """Send arm night command.
-
-        Args:
-            code: The arm code (not used for local API).
-        """
-        _LOGGER.info("Arming alarm in night mode (area %d)", self._area)
-        mode = ALARM_STATE_TO_MODE["arm_night"]
-        await self.coordinator.async_set_alarm_mode(mode, self._area)
+        """Send arm night command. The code is not used for the local API."""
+        await self._send(self._MODE_ARM_NIGHT, "Arming alarm in night mode")
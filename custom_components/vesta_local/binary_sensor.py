@@ -1,7 +1,10 @@
 """Binary Sensor platform for Vesta/Climax Local integration."""
 from __future__ import annotations
 
+import asyncio
 import logging
+import re
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 from homeassistant.components.binary_sensor import (
@@ -14,8 +17,7 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
 from .const import (
     DEVICE_TYPE_TO_BINARY_SENSOR_CLASS,
-    SENSOR_STATUS_OFF,
-    SENSOR_STATUS_ON,
+    STATUS_IS_ON,
 )
 from .entity import VestaDeviceEntity
 
@@ -26,6 +28,41 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
+# Fallback patterns for statuses not covered by the exact-match sets.
+# A single compiled scan is cheaper than chained substring tests.
+_ON_RE = re.compile(r"open|motion|alarm", re.IGNORECASE)
+_OFF_RE = re.compile(r"close|normal|ready", re.IGNORECASE)
+
+# Number of entities registered per async_add_entities call; large panels
+# yield to the event loop between chunks so setup doesn't stall it
+_ADD_ENTITIES_CHUNK = 50
+
+
+@lru_cache(maxsize=64)
+def _decode_status(status: str) -> bool | None:
+    """Decode a panel status string into an is_on value.
+
+    The panel emits a small fixed vocabulary of status strings, so the
+    result is memoized and each unique string is decoded only once.
+
+    Args:
+        status: The raw status string from the panel.
+
+    Returns:
+        True if triggered/open, False if normal/closed, None if unknown.
+    """
+    is_on = STATUS_IS_ON.get(status.casefold())
+    if is_on is not None:
+        return is_on
+
+    # Handle unknown status by checking common patterns
+    if _ON_RE.search(status):
+        return True
+    if _OFF_RE.search(status):
+        return False
+
+    return None
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -42,35 +79,49 @@ async def async_setup_entry(
     coordinator = entry.runtime_data
 
     entities: list[BinarySensorEntity] = []
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
     # Create binary sensor entities for supported device types
     if coordinator.data:
         for device in coordinator.data.devices:
             # Add main device sensor if supported
-            if device.type_f in DEVICE_TYPE_TO_BINARY_SENSOR_CLASS:
+            device_class = DEVICE_TYPE_TO_BINARY_SENSOR_CLASS.get(device.type_f)
+            if device_class is not None:
                 entities.append(
-                    VestaBinarySensor(coordinator, device, entry.entry_id)
+                    VestaBinarySensor(
+                        coordinator, device, entry.entry_id, device_class
+                    )
                 )
-                _LOGGER.debug(
-                    "Adding binary sensor: %s (zone %d, type %s)",
-                    device.name,
-                    device.zone,
-                    device.type_f,
+                if debug:
+                    _LOGGER.debug(
+                        "Adding binary sensor: %s (zone %d, type %s)",
+                        device.name,
+                        device.zone,
+                        device.type_f,
+                    )
+
+            # Add battery sensor only for devices that report battery state
+            # (wireless devices); wired zones would otherwise produce a
+            # perpetually-OK entity that still costs a state slot per tick
+            if device.battery_ok is not None:
+                entities.append(
+                    VestaBatteryBinarySensor(coordinator, device, entry.entry_id)
                 )
+                if debug:
+                    _LOGGER.debug(
+                        "Adding battery sensor for: %s (zone %d)",
+                        device.name,
+                        device.zone,
+                    )
 
-            # Add battery sensor for devices with battery monitoring
-            # battery_ok field is present on all wireless devices
-            entities.append(
-                VestaBatteryBinarySensor(coordinator, device, entry.entry_id)
-            )
-            _LOGGER.debug(
-                "Adding battery sensor for: %s (zone %d)",
-                device.name,
-                device.zone,
-            )
+    # Register in chunks, yielding between them so the event loop can
+    # service other tasks while large panels are set up
+    for start in range(0, len(entities), _ADD_ENTITIES_CHUNK):
+        async_add_entities(entities[start : start + _ADD_ENTITIES_CHUNK])
+        await asyncio.sleep(0)
 
-    async_add_entities(entities)
-    _LOGGER.debug("Added %d binary sensor entities", len(entities))
+    if debug:
+        _LOGGER.debug("Added %d binary sensor entities", len(entities))
 
 
 class VestaBinarySensor(VestaDeviceEntity, BinarySensorEntity):
@@ -90,6 +141,7 @@ class VestaBinarySensor(VestaDeviceEntity, BinarySensorEntity):
         coordinator: VestaDataUpdateCoordinator,
         device: DeviceStatus,
         entry_id: str,
+        device_class: BinarySensorDeviceClass | None = None,
     ) -> None:
         """Initialize the binary sensor.
 
@@ -97,13 +149,15 @@ class VestaBinarySensor(VestaDeviceEntity, BinarySensorEntity):
             coordinator: The data update coordinator.
             device: The device status information.
             entry_id: The config entry ID.
+            device_class: The resolved device class, looked up once by the
+                setup loop to avoid a second dict probe here.
         """
         super().__init__(coordinator, device, entry_id)
 
-        # Set device class based on device type
-        self._attr_device_class = DEVICE_TYPE_TO_BINARY_SENSOR_CLASS.get(
-            device.type_f
-        )
+        self._attr_device_class = device_class
+
+        # Attribute dict cached per device snapshot (keyed on object id)
+        self._attrs_cache: tuple[int, dict[str, str | int | bool]] | None = None
 
     @property
     def is_on(self) -> bool | None:
@@ -121,30 +175,21 @@ class VestaBinarySensor(VestaDeviceEntity, BinarySensorEntity):
         if device is None:
             return None
 
-        status = device.status
-
-        # Check if status indicates "on" state
-        if status in SENSOR_STATUS_ON:
-            return True
-
-        # Check if status indicates "off" state
-        if status in SENSOR_STATUS_OFF:
-            return False
-
-        # Handle unknown status by checking common patterns
-        status_lower = status.lower()
-        if "open" in status_lower or "motion" in status_lower or "alarm" in status_lower:
-            return True
-        if "close" in status_lower or "normal" in status_lower or "ready" in status_lower:
-            return False
-
-        _LOGGER.debug("Unknown sensor status: %s for device %s", status, device.name)
-        return None
+        is_on = _decode_status(device.status)
+        if is_on is None:
+            _LOGGER.debug(
+                "Unknown sensor status: %s for device %s", device.status, device.name
+            )
+        return is_on
 
     @property
     def extra_state_attributes(self) -> dict[str, str | int | bool] | None:
         """Return additional state attributes.
 
+        The dict is rebuilt only when the underlying device snapshot
+        changes; between coordinator updates repeated reads return the
+        cached dict instead of allocating a new one.
+
         Returns:
             Dictionary of extra attributes or None.
         """
@@ -152,7 +197,11 @@ class VestaBinarySensor(VestaDeviceEntity, BinarySensorEntity):
         if device is None:
             return None
 
-        return {
+        cache = self._attrs_cache
+        if cache is not None and cache[0] == id(device):
+            return cache[1]
+
+        attrs: dict[str, str | int | bool] = {
             "zone": device.zone,
             "area": device.area,
             "rssi": device.rssi,
@@ -160,6 +209,8 @@ class VestaBinarySensor(VestaDeviceEntity, BinarySensorEntity):
             "tamper_ok": device.tamper_ok,
             "raw_status": device.status,
         }
+        self._attrs_cache = (id(device), attrs)
+        return attrs
 
 
 class VestaBatteryBinarySensor(VestaDeviceEntity, BinarySensorEntity):
@@ -191,8 +242,9 @@ class VestaBatteryBinarySensor(VestaDeviceEntity, BinarySensorEntity):
         """
         super().__init__(coordinator, device, entry_id)
 
-        # Override unique ID to distinguish from the main sensor
-        self._attr_unique_id = f"{entry_id}_{device.device_id}_battery"
+        # Override unique ID to distinguish from the main sensor,
+        # reusing the shared per-device prefix
+        self._attr_unique_id = self._attr_unique_id + "_battery"
         self._attr_name = "Battery"
 
     @property
@@ -206,11 +258,9 @@ class VestaBatteryBinarySensor(VestaDeviceEntity, BinarySensorEntity):
         Returns:
             True if battery is low, False if OK, None if unknown.
         """
-        device = self.device_data
-        if device is None:
-            return None
-
-        # battery_ok is True when battery is OK, so we invert it
+        # battery_ok is True when battery is OK, so we invert it:
         # battery_ok = True -> is_on = False (battery OK)
         # battery_ok = False -> is_on = True (low battery alert)
-        return not device.battery_ok
+        device = self.device_data
+        ok = device.battery_ok if device is not None else None
+        return None if ok is None else not ok
@@ -7,11 +7,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import re
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any
 
 import httpx
-from pydantic import BaseModel, Field, field_validator
+import orjson
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    TypeAdapter,
+    ValidationError,
+    field_validator,
+)
 
 from .const import (
     DEFAULT_TIMEOUT,
@@ -25,6 +35,43 @@ from .const import (
 
 _LOGGER = logging.getLogger(__name__)
 
+# Retry backoff schedule in seconds, indexed by attempt number
+_BACKOFF: tuple[int, ...] = (1, 2, 4)
+
+# Sentinel returned by _request when a conditional GET answers 304,
+# letting callers reuse their previously parsed result
+_NOT_MODIFIED: Any = object()
+
+# Shared model config: accept aliased or field-name input, drop unknown
+# firmware fields instead of carrying them in __pydantic_extra__, and
+# freeze instances so snapshots are immutable and hashable
+_MODEL_CONFIG = ConfigDict(populate_by_name=True, extra="ignore", frozen=True)
+
+
+@lru_cache(maxsize=32)
+def _urls_for(host: str, use_ssl: bool) -> tuple[str, tuple[tuple[str, str], ...]]:
+    """Build the base URL and static request headers for a panel.
+
+    Config-flow tests and reloads construct clients for the same host
+    repeatedly; memoizing keeps the f-string work to one pass per
+    (host, use_ssl) pair.
+
+    Args:
+        host: Hostname or IP address of the panel.
+        use_ssl: Whether to use HTTPS.
+
+    Returns:
+        Tuple of (base_url, headers) with headers as an item tuple so the
+        cached value stays immutable.
+    """
+    protocol = "https" if use_ssl else "http"
+    headers = (
+        ("X-Requested-With", "XMLHttpRequest"),
+        ("Referer", f"{protocol}://{host}/"),
+        ("Accept", "application/json"),
+    )
+    return f"{protocol}://{host}/action", headers
+
 
 class DeviceStatus(BaseModel):
     """Represents a device/zone status from the panel.
@@ -35,7 +82,8 @@ class DeviceStatus(BaseModel):
         name: Human-readable name of the device.
         type_f: Device type (e.g., "Door Contact", "PIR").
         status: Current status string (e.g., "Door Open", "Door Close").
-        battery_ok: True if battery is OK, False if low.
+        battery_ok: True if battery is OK, False if low, None if the
+            device does not report battery state (wired zones).
         tamper_ok: True if tamper switch is OK.
         rssi: Signal strength indicator.
         device_id: Unique identifier for the device.
@@ -44,22 +92,32 @@ class DeviceStatus(BaseModel):
     area: int
     zone: int
     name: str
-    type_f: str = Field(alias="type_f")
+    type_f: str
     status: str
-    battery_ok: bool = Field(alias="battery_ok")
-    tamper_ok: bool = Field(alias="tamper_ok")
+    battery_ok: bool | None = None
+    tamper_ok: bool
     rssi: str
     device_id: str = Field(alias="id")
 
-    model_config = {"populate_by_name": True}
+    model_config = _MODEL_CONFIG
+
+    def __hash__(self) -> int:
+        """Hash on device_id alone.
+
+        The frozen-model default hashes every field; device_id already
+        identifies the device, so dict and set operations over snapshots
+        only hash one string. Equal snapshots share a device_id, keeping
+        the hash/eq contract intact.
+        """
+        return hash(self.device_id)
 
     @field_validator("battery_ok", "tamper_ok", mode="before")
     @classmethod
-    def parse_binary(cls, value: Any) -> bool:
+    def parse_binary(cls, value: Any) -> bool | None:
         """Parse binary string values to boolean."""
-        if isinstance(value, bool):
-            return value
-        return str(value) == "1"
+        if value is None:
+            return None
+        return value is True or value == "1" or value == 1
 
 
 class PanelStatus(BaseModel):
@@ -77,21 +135,19 @@ class PanelStatus(BaseModel):
     gsm_signal: int = Field(default=0, alias="sig_gsm")
     ac_failure: bool = Field(default=False, alias="ac_fail")
 
-    model_config = {"populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
     @field_validator("ac_failure", mode="before")
     @classmethod
     def parse_ac_failure(cls, value: Any) -> bool:
         """Parse AC failure field to boolean."""
-        if isinstance(value, bool):
-            return value
-        return str(value) == "1"
+        return value is True or value == "1" or value == 1
 
     @field_validator("gsm_signal", mode="before")
     @classmethod
     def parse_gsm_signal(cls, value: Any) -> int:
         """Parse GSM signal to integer."""
-        if isinstance(value, int):
+        if type(value) is int:
             return value
         try:
             return int(value)
@@ -99,6 +155,21 @@ class PanelStatus(BaseModel):
             return 0
 
 
+class _PanelCondEnvelope(BaseModel):
+    """Envelope some firmwares wrap around panelCondGet responses."""
+
+    updates: PanelStatus
+
+    model_config = _MODEL_CONFIG
+
+
+# Fused parse+validate of the raw panelCondGet bytes in one pass; the
+# envelope variant is tried first, bare PanelStatus second
+_PANEL_STATUS_ADAPTER: TypeAdapter[_PanelCondEnvelope | PanelStatus] = TypeAdapter(
+    _PanelCondEnvelope | PanelStatus
+)
+
+
 class EventLogEntry(BaseModel):
     """Represents an event log entry from the panel.
 
@@ -122,7 +193,7 @@ class EventLogEntry(BaseModel):
     device_type: str = Field(default="")
     msg: str = Field(default="")
 
-    model_config = {"populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
 
 class ReportedEvent(BaseModel):
@@ -138,13 +209,13 @@ class ReportedEvent(BaseModel):
     new_event: str = Field(default="")
     cid_event: str = Field(default="")
 
-    model_config = {"populate_by_name": True}
+    model_config = _MODEL_CONFIG
 
     @field_validator("uid", mode="before")
     @classmethod
     def parse_uid(cls, value: Any) -> int:
         """Parse uid to integer."""
-        if isinstance(value, int):
+        if type(value) is int:
             return value
         try:
             return int(value)
@@ -152,6 +223,103 @@ class ReportedEvent(BaseModel):
             return 0
 
 
+# Bulk list adapters built once at import; validating a whole list in a
+# single call avoids re-entering pydantic-core's schema dispatch per row
+_DEVICES_ADAPTER: TypeAdapter[list[DeviceStatus]] = TypeAdapter(list[DeviceStatus])
+_EVENTS_ADAPTER: TypeAdapter[list[EventLogEntry]] = TypeAdapter(list[EventLogEntry])
+
+
+def _build_device(row: dict[str, Any]) -> DeviceStatus:
+    """Build a DeviceStatus from a trusted panel row without validation.
+
+    The panel payload is machine-generated with a fixed shape, so the hot
+    polling path skips pydantic validation via model_construct and does
+    the alias renames and binary coercions inline. Rows with an
+    unexpected shape raise and the caller falls back to full validation.
+
+    Args:
+        row: A raw "senrows" entry from the panel.
+
+    Returns:
+        The constructed DeviceStatus.
+    """
+    # Same coercion as the parse_binary validator, so boolean payloads
+    # from firmware that emits JSON true/false decode identically on
+    # both paths
+    battery_ok = row.get("battery_ok")
+    tamper_ok = row["tamper_ok"]
+    return DeviceStatus.model_construct(
+        area=int(row["area"]),
+        zone=int(row["zone"]),
+        name=row["name"],
+        type_f=row["type_f"],
+        status=row["status"],
+        battery_ok=None
+        if battery_ok is None
+        else battery_ok is True or battery_ok == "1" or battery_ok == 1,
+        tamper_ok=tamper_ok is True or tamper_ok == "1" or tamper_ok == 1,
+        rssi=row["rssi"],
+        device_id=row["id"],
+    )
+
+
+def _build_event(row: dict[str, Any]) -> EventLogEntry:
+    """Build an EventLogEntry from a trusted panel row without validation.
+
+    Args:
+        row: A raw "logrows" entry from the panel.
+
+    Returns:
+        The constructed EventLogEntry.
+    """
+    return EventLogEntry.model_construct(
+        log_time=row.get("log_time", ""),
+        area=row.get("area", ""),
+        mode=row.get("mode", ""),
+        action=row.get("action", ""),
+        user=row.get("user", ""),
+        source=row.get("source", ""),
+        device_type=row.get("device_type", ""),
+        msg=row.get("msg", ""),
+    )
+
+
+async def _empty_event_log() -> list[EventLogEntry]:
+    """Stand-in awaitable for ticks that skip the event log fetch."""
+    return []
+
+
+# Zone number embedded in event source strings; unanchored because some
+# firmwares prefix the source (e.g. "Area1 Zone3")
+_ZONE_RE = re.compile(r"Zone(\d+)")
+
+
+def extract_zone(source: str) -> int | None:
+    """Extract the zone number from an event source string.
+
+    Shared by the coordinator's zone index and the sensor platform so
+    there is exactly one definition of how sources map to zones.
+
+    Args:
+        source: The raw source field of an event log entry.
+
+    Returns:
+        The zone number, or None if the source names no zone.
+    """
+    # Panels emit sources as "Zone<n>..." almost exclusively, so the
+    # common case is parsed with plain string ops and never enters the
+    # regex engine; the regex only runs for other shapes
+    if source.startswith("Zone"):
+        end = 4
+        length = len(source)
+        while end < length and source[end].isdigit():
+            end += 1
+        if end > 4:
+            return int(source[4:end])
+    match = _ZONE_RE.search(source)
+    return int(match.group(1)) if match else None
+
+
 @dataclass
 class VestaData:
     """Container for all data retrieved from the panel.
@@ -198,6 +366,7 @@ class VestaLocalClient:
         password: str,
         verify_ssl: bool = False,
         use_ssl: bool = False,
+        client: httpx.AsyncClient | None = None,
     ) -> None:
         """Initialize the Vesta Local Client.
 
@@ -208,46 +377,56 @@ class VestaLocalClient:
             verify_ssl: Whether to verify SSL certificates. Default False for
                 self-signed certs common on local panels.
             use_ssl: Whether to use HTTPS. Default False (use HTTP).
+            client: Optional externally-owned httpx client (e.g. Home
+                Assistant's shared client). When provided, the connection
+                pool is reused and close() will not close it.
         """
         self._host = host
         self._username = username
         self._password = password
         self._verify_ssl = verify_ssl
         self._use_ssl = use_ssl
-        self._client: httpx.AsyncClient | None = None
-
-        protocol = "https" if use_ssl else "http"
-        self._base_url = f"{protocol}://{host}/action"
-        self._headers = {
-            "X-Requested-With": "XMLHttpRequest",
-            "Referer": f"{protocol}://{host}/",
-            "Accept": "application/json",
-        }
+        self._owns_client = client is None
+        if client is None:
+            # Keep a small pool of kept-alive connections so the 5s polling
+            # cycle reuses one TCP/TLS session instead of re-handshaking
+            client = httpx.AsyncClient(
+                verify=verify_ssl,
+                follow_redirects=False,
+                limits=httpx.Limits(
+                    max_connections=10,
+                    max_keepalive_connections=4,
+                    keepalive_expiry=75,
+                ),
+            )
+        self._client: httpx.AsyncClient | None = client
+        self._auth = httpx.BasicAuth(username, password)
+        self._timeout = httpx.Timeout(DEFAULT_TIMEOUT)
+
+        # Cache validators (ETag/Last-Modified) and the last parsed result
+        # per endpoint; panels that honour conditional GETs then answer
+        # idle polls with a bodyless 304 and we skip re-parsing entirely
+        self._validators: dict[str, dict[str, str]] = {}
+        self._last_panel: PanelStatus | None = None
+        self._last_devices: list[DeviceStatus] | None = None
+
+        self._base_url, headers = _urls_for(host, use_ssl)
+        self._headers = dict(headers)
+        # Built once; retry error messages only append the failure suffix
+        self._host_err_prefix = f"Connection to {host} "
 
     @property
     def host(self) -> str:
         """Return the host address."""
         return self._host
 
-    async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create the httpx client.
-
-        Returns:
-            The httpx AsyncClient instance.
-        """
-        if self._client is None or self._client.is_closed:
-            # Use Basic Auth for Vesta/Climax panels
-            auth = httpx.BasicAuth(self._username, self._password)
-
-            self._client = httpx.AsyncClient(
-                auth=auth,
-                headers=self._headers,
-                timeout=httpx.Timeout(DEFAULT_TIMEOUT),
-                verify=self._verify_ssl,
-                follow_redirects=False,
-            )
+    async def __aenter__(self) -> VestaLocalClient:
+        """Enter the async context, returning the client."""
+        return self
 
-        return self._client
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Exit the async context, closing an owned session."""
+        await self.close()
 
     async def _request(
         self,
@@ -255,7 +434,9 @@ class VestaLocalClient:
         endpoint: str,
         data: dict[str, Any] | None = None,
         retry_count: int = 2,
-    ) -> dict[str, Any]:
+        raw: bool = False,
+        conditional: bool = False,
+    ) -> dict[str, Any] | bytes:
         """Make an HTTP request to the panel.
 
         Args:
@@ -263,9 +444,14 @@ class VestaLocalClient:
             endpoint: API endpoint (without /action/ prefix).
             data: Optional form data for POST requests.
             retry_count: Number of retries on failure.
+            raw: If True, return the undecoded response body so callers
+                can hand the bytes to pydantic in a single fused pass.
+            conditional: If True, send cached ETag/Last-Modified validators
+                for this endpoint and return _NOT_MODIFIED on a 304.
 
         Returns:
-            The JSON response as a dictionary.
+            The JSON response as a dictionary, the raw body bytes when raw
+            is True, or _NOT_MODIFIED for an unchanged conditional GET.
 
         Raises:
             VestaAuthenticationError: If authentication fails (401).
@@ -273,46 +459,102 @@ class VestaLocalClient:
             VestaApiError: If the API returns an error.
         """
         url = f"{self._base_url}/{endpoint}"
-        client = await self._get_client()
+        client = self._client
+        if client is None:
+            raise VestaConnectionError(f"Client for {self._host} is closed")
+
+        headers = self._headers
+        if conditional:
+            validators = self._validators.get(endpoint)
+            if validators:
+                headers = {**headers, **validators}
 
         last_error: Exception | None = None
 
         for attempt in range(retry_count + 1):
             try:
                 if method.upper() == "GET":
-                    response = await client.get(url)
+                    response = await client.get(
+                        url,
+                        headers=headers,
+                        auth=self._auth,
+                        timeout=self._timeout,
+                    )
                 else:
-                    response = await client.post(url, data=data)
+                    response = await client.post(
+                        url,
+                        data=data,
+                        headers=self._headers,
+                        auth=self._auth,
+                        timeout=self._timeout,
+                    )
 
                 if response.status_code == 401:
                     raise VestaAuthenticationError(
                         f"Authentication failed for {self._host}"
                     )
 
+                if conditional and response.status_code == 304:
+                    return _NOT_MODIFIED
+
                 if response.status_code >= 400:
+                    # Decode only a bounded slice for the message; .text would
+                    # charset-sniff and decode the whole body just to raise
+                    body = response.content[:256].decode("utf-8", errors="replace")
                     raise VestaApiError(
-                        f"API error {response.status_code}: {response.text}"
+                        f"API error {response.status_code}: {body}"
                     )
 
+                if conditional:
+                    validators = {}
+                    etag = response.headers.get("etag")
+                    if etag:
+                        validators["If-None-Match"] = etag
+                    last_modified = response.headers.get("last-modified")
+                    if last_modified:
+                        validators["If-Modified-Since"] = last_modified
+                    if validators:
+                        self._validators[endpoint] = validators
+
+                if raw:
+                    return response.content
+
                 # Check if response is JSON
                 content_type = response.headers.get("content-type", "")
                 if "application/json" not in content_type and "text/json" not in content_type:
                     # Try to parse as JSON anyway (some panels don't set content-type correctly)
                     try:
-                        return response.json()
-                    except Exception:
+                        return orjson.loads(response.content)
+                    except orjson.JSONDecodeError:
+                        body = response.content[:256].decode(
+                            "utf-8", errors="replace"
+                        )
                         raise VestaApiError(
-                            f"Unexpected response type '{content_type}' from {url}: {response.text[:200]}"
+                            f"Unexpected response type '{content_type}' from {url}: {body}"
                         )
 
-                return response.json()
+                return orjson.loads(response.content)
 
-            except httpx.ConnectError as err:
-                last_error = VestaConnectionError(
-                    f"Connection to {self._host} failed: {err}"
-                )
+            except (VestaAuthenticationError, VestaApiError):
+                raise
+
+            except httpx.HTTPError as err:
+                # ConnectError and TimeoutException are HTTPError subclasses,
+                # so one handler covers all three transport failure modes
+                if isinstance(err, httpx.TimeoutException):
+                    last_error = VestaConnectionError(
+                        self._host_err_prefix + "timed out"
+                    )
+                elif isinstance(err, httpx.ConnectError):
+                    last_error = VestaConnectionError(
+                        self._host_err_prefix + f"failed: {err}"
+                    )
+                else:
+                    last_error = VestaConnectionError(
+                        self._host_err_prefix + f"failed (HTTP error): {err}"
+                    )
                 if attempt < retry_count:
-                    wait_time = 2**attempt
+                    wait_time = _BACKOFF[min(attempt, len(_BACKOFF) - 1)]
                     _LOGGER.debug(
                         "Request failed, retrying in %ds (attempt %d/%d): %s",
                         wait_time,
@@ -323,33 +565,6 @@ class VestaLocalClient:
                     await asyncio.sleep(wait_time)
                 continue
 
-            except httpx.TimeoutException:
-                last_error = VestaConnectionError(
-                    f"Connection to {self._host} timed out"
-                )
-                if attempt < retry_count:
-                    wait_time = 2**attempt
-                    _LOGGER.debug(
-                        "Request timed out, retrying in %ds (attempt %d/%d)",
-                        wait_time,
-                        attempt + 1,
-                        retry_count + 1,
-                    )
-                    await asyncio.sleep(wait_time)
-                continue
-
-            except (VestaAuthenticationError, VestaApiError):
-                raise
-
-            except httpx.HTTPError as err:
-                last_error = VestaConnectionError(
-                    f"HTTP error for {self._host}: {err}"
-                )
-                if attempt < retry_count:
-                    wait_time = 2**attempt
-                    await asyncio.sleep(wait_time)
-                continue
-
         if last_error:
             raise last_error
 
@@ -367,7 +582,11 @@ class VestaLocalClient:
         """
         _LOGGER.debug("Testing authentication with %s", self._host)
         try:
-            # Use panelCondGet to test auth (login endpoint returns HTML)
+            # Use panelCondGet to test auth (login endpoint returns HTML).
+            # The decoded request keeps the content-type/JSON sanity check
+            # so a non-panel host answering 200 with HTML still fails the
+            # config flow here instead of at first refresh; this runs once
+            # per setup, so the decode cost is irrelevant
             await self._request("GET", ENDPOINT_PANEL_STATUS)
             _LOGGER.debug("Authentication successful for %s", self._host)
             return True
@@ -386,15 +605,23 @@ class VestaLocalClient:
             VestaApiError: If parsing fails.
         """
         _LOGGER.debug("Fetching panel status from %s", self._host)
-        json_data = await self._request("GET", ENDPOINT_PANEL_STATUS)
+        conditional = self._last_panel is not None
+        raw = await self._request(
+            "GET", ENDPOINT_PANEL_STATUS, raw=True, conditional=conditional
+        )
+        if raw is _NOT_MODIFIED:
+            return self._last_panel
 
         try:
-            updates = json_data.get("updates", json_data)
-            return PanelStatus.model_validate(updates)
+            result = _PANEL_STATUS_ADAPTER.validate_json(raw)
         except Exception as err:
             _LOGGER.error("Failed to parse panel status: %s", err)
             raise VestaApiError(f"Failed to parse panel status: {err}") from err
 
+        panel = result.updates if isinstance(result, _PanelCondEnvelope) else result
+        self._last_panel = panel
+        return panel
+
     async def get_devices(self) -> list[DeviceStatus]:
         """Get the list of all devices/zones.
 
@@ -406,31 +633,61 @@ class VestaLocalClient:
             VestaApiError: If parsing fails.
         """
         _LOGGER.debug("Fetching device list from %s", self._host)
-        json_data = await self._request("GET", ENDPOINT_DEVICE_LIST)
+        conditional = self._last_devices is not None
+        json_data = await self._request(
+            "GET", ENDPOINT_DEVICE_LIST, conditional=conditional
+        )
+        if json_data is _NOT_MODIFIED:
+            return self._last_devices
+        rows = json_data.get("senrows", [])
 
+        # Trusted fast path: construct without validation
         try:
-            devices = []
-            for device_data in json_data.get("senrows", []):
-                try:
-                    devices.append(DeviceStatus.model_validate(device_data))
-                except Exception as err:
-                    _LOGGER.warning(
-                        "Failed to parse device %s: %s",
-                        device_data.get("id", "unknown"),
-                        err,
-                    )
+            devices = [_build_device(row) for row in rows]
+        except (AttributeError, KeyError, TypeError, ValueError):
+            _LOGGER.debug("Device list has unexpected shape; validating")
+        else:
+            self._last_devices = devices
             return devices
-        except Exception as err:
-            _LOGGER.error("Failed to parse device list: %s", err)
-            raise VestaApiError(f"Failed to parse device list: {err}") from err
 
-    async def get_all_data(self) -> VestaData:
+        # Bulk validation in a single schema dispatch
+        try:
+            devices = _DEVICES_ADAPTER.validate_python(rows)
+        except ValidationError:
+            pass
+        else:
+            self._last_devices = devices
+            return devices
+
+        # Per-row validation so offending rows are logged and skipped
+        devices = []
+        for device_data in rows:
+            try:
+                devices.append(DeviceStatus.model_validate(device_data))
+            except Exception as err:
+                _LOGGER.warning(
+                    "Failed to parse device %s: %s",
+                    device_data.get("id", "unknown")
+                    if isinstance(device_data, dict)
+                    else "unknown",
+                    err,
+                )
+        self._last_devices = devices
+        return devices
+
+    async def get_all_data(self, include_event_log: bool = True) -> VestaData:
         """Get all data from the panel in a single call.
 
         This method fetches panel status, device list, event log, and reported
         events concurrently. Event log and reported events failures are
         non-critical and degrade gracefully to empty lists.
 
+        Args:
+            include_event_log: If False, skip the event log request entirely;
+                the returned VestaData carries an empty log and the caller
+                reuses its previous one. The coordinator polls the log at a
+                slower cadence than the panel status.
+
         Returns:
             VestaData object containing panel status, devices, event log,
             and reported events.
@@ -438,7 +695,9 @@ class VestaLocalClient:
         _LOGGER.debug("Fetching all data from %s", self._host)
         panel_task = self.get_panel_status()
         devices_task = self.get_devices()
-        event_log_task = self.get_event_log()
+        event_log_task = (
+            self.get_event_log() if include_event_log else _empty_event_log()
+        )
         reported_events_task = self.get_reported_events()
 
         panel, devices, event_log_result, reported_events_result = await asyncio.gather(
@@ -469,11 +728,13 @@ class VestaLocalClient:
             reported_events=reported_events_result,
         )
 
-    async def get_event_log(self, max_count: int = 1000) -> list[EventLogEntry]:
+    async def get_event_log(self, max_count: int = 200) -> list[EventLogEntry]:
         """Get the event log from the panel.
 
         Args:
-            max_count: Maximum number of log entries to request. Default is 20.
+            max_count: Maximum number of log entries to request. Default is
+                200, which bounds the payload the panel serializes and we
+                decode; callers needing deeper history can raise it.
 
         Returns:
             List of EventLogEntry objects, sorted by most recent first.
@@ -486,21 +747,31 @@ class VestaLocalClient:
         json_data = await self._request(
             "POST", ENDPOINT_EVENT_LOG, data={"max_count": str(max_count)}
         )
+        rows = json_data.get("logrows", [])
+        # Some firmwares ignore max_count; never parse more than requested
+        if len(rows) > max_count:
+            rows = rows[:max_count]
 
+        # Trusted fast path: construct without validation
         try:
-            events = []
-            for event_data in json_data.get("logrows", []):
-                try:
-                    events.append(EventLogEntry.model_validate(event_data))
-                except Exception as err:
-                    _LOGGER.warning(
-                        "Failed to parse event log entry: %s",
-                        err,
-                    )
-            return events
-        except Exception as err:
-            _LOGGER.error("Failed to parse event log: %s", err)
-            raise VestaApiError(f"Failed to parse event log: {err}") from err
+            return [_build_event(row) for row in rows]
+        except (AttributeError, TypeError):
+            _LOGGER.debug("Event log has unexpected shape; validating")
+
+        # Bulk validation in a single schema dispatch
+        try:
+            return _EVENTS_ADAPTER.validate_python(rows)
+        except ValidationError:
+            pass
+
+        # Per-row validation so offending rows are logged and skipped
+        events = []
+        for event_data in rows:
+            try:
+                events.append(EventLogEntry.model_validate(event_data))
+            except Exception as err:
+                _LOGGER.warning("Failed to parse event log entry: %s", err)
+        return events
 
     async def get_reported_events(self, max_count: int = 200) -> list[ReportedEvent]:
         """Get reported events from the panel for triggered state detection.
@@ -558,18 +829,29 @@ class VestaLocalClient:
             self._host,
         )
         payload = {"area": str(area), "mode": str(mode)}
-        response = await self._request("POST", ENDPOINT_PANEL_SET, data=payload)
-
-        result = response.get("result")
-        if result == 1 or result == "1":
+        raw = await self._request("POST", ENDPOINT_PANEL_SET, data=payload, raw=True)
+
+        # The tiny response only needs a result flag; two substring scans
+        # beat a full JSON decode on this latency-sensitive user action
+        if any(
+            token in raw
+            for token in (b'"result":1', b'"result":"1"', b'"result": 1', b'"result": "1"')
+        ):
             _LOGGER.debug("Alarm mode set successfully")
             return True
 
-        _LOGGER.error("Failed to set alarm mode: %s", response)
+        _LOGGER.error("Failed to set alarm mode: %s", raw[:200])
         return False
 
     async def close(self) -> None:
-        """Close the client session."""
+        """Close the client session.
+
+        Externally-owned clients (shared sessions) are left open; only a
+        client created by this instance is closed.
+        """
+        if not self._owns_client:
+            self._client = None
+            return
         if self._client and not self._client.is_closed:
             await self._client.aclose()
             self._client = None
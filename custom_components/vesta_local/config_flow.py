@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any
 
 import voluptuous as vol
@@ -34,12 +35,29 @@ DATA_SCHEMA = vol.Schema(
     }
 )
 
-REAUTH_SCHEMA = vol.Schema(
-    {
-        vol.Required(CONF_USERNAME): str,
-        vol.Required(CONF_PASSWORD): str,
-    }
-)
+
+@lru_cache(maxsize=8)
+def _reauth_schema(username: str) -> vol.Schema:
+    """Build the reauth form schema with the username pre-filled.
+
+    Memoized so the schema is built once per username instead of on
+    every render of the reauth form (including validation-error redraws).
+
+    Args:
+        username: The current username to suggest in the form.
+
+    Returns:
+        The voluptuous schema for the reauth confirmation step.
+    """
+    return vol.Schema(
+        {
+            vol.Required(
+                CONF_USERNAME, description={"suggested_value": username}
+            ): str,
+            vol.Required(CONF_PASSWORD): str,
+        }
+    )
+
 
 ZEROCONF_SCHEMA = vol.Schema(
     {
@@ -226,11 +244,10 @@ class VestaLocalConfigFlow(ConfigFlow, domain=DOMAIN):
 
         return self.async_show_form(
             step_id="reauth_confirm",
-            data_schema=self.add_suggested_values_to_schema(
-                REAUTH_SCHEMA,
-                {CONF_USERNAME: self._reauth_entry.data.get(CONF_USERNAME, "")}
+            data_schema=_reauth_schema(
+                self._reauth_entry.data.get(CONF_USERNAME, "")
                 if self._reauth_entry
-                else {},
+                else ""
             ),
             errors=errors,
             description_placeholders={"host": self._host},
@@ -250,17 +267,16 @@ class VestaLocalConfigFlow(ConfigFlow, domain=DOMAIN):
         Returns:
             Error string if connection fails, None if successful.
         """
-        client = VestaLocalClient(
-            host=host,
-            username=username,
-            password=password,
-            verify_ssl=False,
-            use_ssl=use_ssl,
-        )
-
         try:
-            await client.authenticate()
-            return None
+            async with VestaLocalClient(
+                host=host,
+                username=username,
+                password=password,
+                verify_ssl=False,
+                use_ssl=use_ssl,
+            ) as client:
+                await client.authenticate()
+                return None
 
         except VestaAuthenticationError:
             _LOGGER.warning("Authentication failed for %s", host)
@@ -274,9 +290,6 @@ class VestaLocalConfigFlow(ConfigFlow, domain=DOMAIN):
             _LOGGER.exception("Unexpected error connecting to %s: %s", host, err)
             return "unknown"
 
-        finally:
-            await client.close()
-
     @staticmethod
     @callback
     def async_get_options_flow(
@@ -305,23 +318,21 @@ class VestaLocalOptionsFlow(OptionsFlow):
             use_ssl = user_input.get(CONF_USE_SSL, False)
 
             # Test connection with new credentials
-            client = VestaLocalClient(
-                host=host,
-                username=username,
-                password=password,
-                verify_ssl=False,
-                use_ssl=use_ssl,
-            )
             try:
-                await client.authenticate()
+                async with VestaLocalClient(
+                    host=host,
+                    username=username,
+                    password=password,
+                    verify_ssl=False,
+                    use_ssl=use_ssl,
+                ) as client:
+                    await client.authenticate()
             except VestaAuthenticationError:
                 errors["base"] = "invalid_auth"
             except VestaConnectionError:
                 errors["base"] = "cannot_connect"
             except Exception:
                 errors["base"] = "unknown"
-            finally:
-                await client.close()
 
             if not errors:
                 self.hass.config_entries.async_update_entry(
@@ -1,4 +1,5 @@
 """Constants for the Vesta/Climax Local integration."""
+from types import MappingProxyType
 from typing import Final
 
 from homeassistant.components.alarm_control_panel import AlarmControlPanelState
@@ -26,28 +27,36 @@ ENDPOINT_REPORTED_EVENTS: Final = "reportEventListGet"
 # Polling configuration
 DEFAULT_SCAN_INTERVAL: Final = 5  # seconds
 
-# Alarm mode mappings (Panel -> Home Assistant)
-ALARM_MODE_TO_STATE: dict[str, AlarmControlPanelState] = {
-    "Disarm": AlarmControlPanelState.DISARMED,
+# Adaptive polling: the fast interval applies while armed, triggered or
+# right after a command; disarmed-idle panels relax to the slow interval
+IDLE_SCAN_INTERVAL: Final = 15  # seconds
+COMMAND_BURST_TICKS: Final = 6  # refreshes kept fast after a mode change
+
+# The event log changes far less often than panel/device state, so it is
+# only fetched every Nth coordinator refresh (~30s at the default tick)
+EVENT_LOG_SCAN_TICKS: Final = 6
+
+# Alarm mode mappings (Panel -> Home Assistant). Keys are casefolded;
+# callers normalize the panel's cased variants with str.casefold() before
+# looking up, so each mode appears exactly once here. Read-only so the
+# table can never be mutated or rebuilt at runtime.
+ALARM_MODE_TO_STATE: MappingProxyType[str, AlarmControlPanelState] = MappingProxyType({
     "disarm": AlarmControlPanelState.DISARMED,
-    "Full Arm": AlarmControlPanelState.ARMED_AWAY,
     "full arm": AlarmControlPanelState.ARMED_AWAY,
-    "Home Arm 1": AlarmControlPanelState.ARMED_HOME,
     "home arm 1": AlarmControlPanelState.ARMED_HOME,
-    "Night": AlarmControlPanelState.ARMED_NIGHT,
     "night": AlarmControlPanelState.ARMED_NIGHT,
-}
+})
 
 # Alarm mode mappings (Home Assistant -> Panel POST value)
-ALARM_STATE_TO_MODE: dict[str, int] = {
+ALARM_STATE_TO_MODE: MappingProxyType[str, int] = MappingProxyType({
     "disarm": 0,
     "arm_away": 1,
     "arm_home": 2,
     "arm_night": 3,
-}
+})
 
 # Device type mappings
-DEVICE_TYPE_NAMES: dict[str, str] = {
+DEVICE_TYPE_NAMES: MappingProxyType[str, str] = MappingProxyType({
     "Door Contact": "Door Contact",
     "IR": "Motion Detector",
     "PIR": "Motion Detector",
@@ -58,10 +67,10 @@ DEVICE_TYPE_NAMES: dict[str, str] = {
     "Keypad": "Keypad",
     "Remote": "Remote Controller",
     "Siren": "Siren",
-}
+})
 
 # Device type icon mappings (Material Design Icons)
-DEVICE_TYPE_ICONS: dict[str, str] = {
+DEVICE_TYPE_ICONS: MappingProxyType[str, str] = MappingProxyType({
     "Door Contact": "mdi:door-sensor",
     "IR": "mdi:motion-sensor",
     "PIR": "mdi:motion-sensor",
@@ -73,10 +82,12 @@ DEVICE_TYPE_ICONS: dict[str, str] = {
     "Remote": "mdi:remote",
     "Siren": "mdi:bullhorn",
     "SVGS": "mdi:vibrate",
-}
+})
 
 # Binary sensor device class mappings
-DEVICE_TYPE_TO_BINARY_SENSOR_CLASS: dict[str, BinarySensorDeviceClass] = {
+DEVICE_TYPE_TO_BINARY_SENSOR_CLASS: MappingProxyType[
+    str, BinarySensorDeviceClass
+] = MappingProxyType({
     "Door Contact": BinarySensorDeviceClass.DOOR,
     "IR": BinarySensorDeviceClass.MOTION,
     "PIR": BinarySensorDeviceClass.MOTION,
@@ -84,29 +95,40 @@ DEVICE_TYPE_TO_BINARY_SENSOR_CLASS: dict[str, BinarySensorDeviceClass] = {
     "CO Detector": BinarySensorDeviceClass.CO,
     "Water Sensor": BinarySensorDeviceClass.MOISTURE,
     "Glass Break": BinarySensorDeviceClass.VIBRATION,
-}
-
-# Sensor status mappings (status string -> is_on boolean)
-SENSOR_STATUS_ON: set[str] = {
-    "Door Open",
-    "Open",
-    "Triggered",
-    "Motion",
-    "Alarm",
-    "Active",
-    "Tamper",
-    "Low Battery",
-}
-
-SENSOR_STATUS_OFF: set[str] = {
-    "Door Close",
-    "Close",
-    "Closed",
-    "Normal",
-    "Ready",
-    "Standby",
-    "OK",
-}
+})
+
+# Sensor status mappings (status string -> is_on boolean). Entries are
+# casefolded; consumers casefold the panel string before membership tests
+SENSOR_STATUS_ON: frozenset[str] = frozenset({
+    "door open",
+    "open",
+    "triggered",
+    "motion",
+    "alarm",
+    "active",
+    "tamper",
+    "low battery",
+})
+
+SENSOR_STATUS_OFF: frozenset[str] = frozenset({
+    "door close",
+    "close",
+    "closed",
+    "normal",
+    "ready",
+    "standby",
+    "ok",
+})
+
+# Combined decision table so consumers resolve a status with one dict
+# lookup instead of two set membership tests
+STATUS_IS_ON: MappingProxyType[str, bool] = MappingProxyType(
+    {s: True for s in SENSOR_STATUS_ON} | {s: False for s in SENSOR_STATUS_OFF}
+)
+
+# Maximum number of events exposed in sensor attributes, bounding both
+# enrichment work and Home Assistant's 16384 byte state attribute limit
+MAX_EVENTS_IN_ATTRIBUTES: Final = 20
 
 # Diagnostic entity keys
 DIAG_BATTERY: Final = "battery"
@@ -114,8 +136,8 @@ DIAG_GSM_SIGNAL: Final = "sig_gsm"
 DIAG_AC_FAILURE: Final = "ac_fail"
 
 # Contact ID codes for triggered alarm detection
-CID_TRIGGER_EVENTS: Final[set[str]] = {"130", "131", "132"}
-CID_DISARM_EVENTS: Final[set[str]] = {"400", "401"}
+CID_TRIGGER_EVENTS: Final[frozenset[str]] = frozenset({"130", "131", "132"})
+CID_DISARM_EVENTS: Final[frozenset[str]] = frozenset({"400", "401"})
 
 # Default values
 DEFAULT_PORT: Final = 80
@@ -4,21 +4,37 @@ This module manages data polling and state updates for the alarm panel.
 """
 from __future__ import annotations
 
+import asyncio
 import logging
+from dataclasses import replace
 from datetime import timedelta
 from typing import TYPE_CHECKING
 
 from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .client import (
+    DeviceStatus,
+    EventLogEntry,
     VestaApiError,
     VestaAuthenticationError,
     VestaConnectionError,
     VestaData,
     VestaLocalClient,
+    extract_zone,
+)
+from .const import (
+    CID_TRIGGER_EVENTS,
+    COMMAND_BURST_TICKS,
+    DEFAULT_SCAN_INTERVAL,
+    DEVICE_TYPE_NAMES,
+    DOMAIN,
+    EVENT_LOG_SCAN_TICKS,
+    IDLE_SCAN_INTERVAL,
+    MANUFACTURER,
+    MAX_EVENTS_IN_ATTRIBUTES,
 )
-from .const import DEFAULT_SCAN_INTERVAL, DOMAIN
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
@@ -55,6 +71,41 @@ class VestaDataUpdateCoordinator(DataUpdateCoordinator[VestaData]):
         self.client = client
         self.config_entry = config_entry
 
+        # Device indexes rebuilt on every refresh so consumers resolve a
+        # device in O(1) instead of scanning the device list; zone is the
+        # key used when matching event-log entries back to devices
+        self.devices_by_id: dict[str, DeviceStatus] = {}
+        self.devices_by_zone: dict[int, DeviceStatus] = {}
+
+        # Event log grouped by zone, built in one pass per refresh so
+        # per-device event sensors avoid scanning the whole log
+        self.events_by_zone: dict[int, list[EventLogEntry]] = {}
+
+        # Triggered-state flag computed once per refresh; entity reads
+        # collapse to a plain attribute load
+        self.is_alarm_triggered: bool = False
+
+        # Refresh counter driving the slower event-log cadence
+        self._tick: int = 0
+
+        # Remaining refreshes to keep polling fast after a mode command,
+        # so the panel's response to arm/disarm is picked up promptly
+        self._burst_ticks: int = 0
+
+        # In-flight mode command, keyed on (mode, area); duplicate
+        # requests from double-taps or bursty automations share one
+        # HTTP round-trip and one follow-up refresh
+        self._inflight_set: tuple[tuple[int, int], asyncio.Task[bool]] | None = None
+
+        # DeviceInfo and the "<entry_id>_<device_id>" unique-id prefix are
+        # built once per device and shared by every entity of that device
+        # (main sensor, battery sensor, last-event sensor)
+        self._device_infos: dict[str, DeviceInfo] = {}
+        self.device_uids: dict[str, str] = {}
+
+        # Shared display name for panel-level entities
+        self.panel_name = f"Vesta Panel ({client.host})"
+
         super().__init__(
             hass,
             _LOGGER,
@@ -62,11 +113,12 @@ class VestaDataUpdateCoordinator(DataUpdateCoordinator[VestaData]):
             update_interval=timedelta(seconds=DEFAULT_SCAN_INTERVAL),
         )
 
-        _LOGGER.debug(
-            "Coordinator initialized for %s with %ds interval",
-            client.host,
-            DEFAULT_SCAN_INTERVAL,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "Coordinator initialized for %s with %ds interval",
+                client.host,
+                DEFAULT_SCAN_INTERVAL,
+            )
 
     async def _async_update_data(self) -> VestaData:
         """Fetch data from the panel.
@@ -80,14 +132,62 @@ class VestaDataUpdateCoordinator(DataUpdateCoordinator[VestaData]):
         Raises:
             UpdateFailed: If the update fails.
         """
+        # Panel status, devices and reported events refresh on every tick;
+        # the event log only every EVENT_LOG_SCAN_TICKS, reusing the
+        # previous log in between
+        include_log = self._tick % EVENT_LOG_SCAN_TICKS == 0
+        self._tick += 1
+
         try:
-            data = await self.client.get_all_data()
-            _LOGGER.debug(
-                "Updated data: mode=%s, devices=%d, events=%d",
-                data.panel.mode,
-                len(data.devices),
-                len(data.event_log),
+            data = await self.client.get_all_data(include_event_log=include_log)
+            if not include_log and self.data is not None:
+                data = replace(data, event_log=self.data.event_log)
+
+            # Unchanged payloads hand back the previous snapshot: the
+            # indexes and triggered flag stay valid, and keeping object
+            # identity lets entity-level caches keyed on id() hit too
+            prev = self.data
+            if prev is not None and data == prev:
+                if self._burst_ticks:
+                    self._burst_ticks -= 1
+                self.update_interval = timedelta(seconds=self._interval_for(prev))
+                return prev
+
+            self.devices_by_id = {d.device_id: d for d in data.devices}
+            self.devices_by_zone = {d.zone: d for d in data.devices}
+
+            # Per-zone lists are capped at what the sensors can expose,
+            # so deep logs don't grow the index past useful size
+            events_by_zone: dict[int, list[EventLogEntry]] = {}
+            for event in data.event_log:
+                zone = extract_zone(event.source)
+                if zone is not None:
+                    zone_events = events_by_zone.setdefault(zone, [])
+                    if len(zone_events) < MAX_EVENTS_IN_ATTRIBUTES:
+                        zone_events.append(event)
+            self.events_by_zone = events_by_zone
+
+            # Reported events are sorted by uid descending, so the first
+            # entry is the most recent
+            events = data.reported_events
+            self.is_alarm_triggered = bool(
+                events
+                and events[0].new_event == "Trigger"
+                and events[0].cid_event in CID_TRIGGER_EVENTS
             )
+            if self._burst_ticks:
+                self._burst_ticks -= 1
+            self.update_interval = timedelta(seconds=self._interval_for(data))
+
+            # Gated so the len() calls and attribute reads are skipped
+            # entirely on every tick when debug logging is off
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Updated data: mode=%s, devices=%d, events=%d",
+                    data.panel.mode,
+                    len(data.devices),
+                    len(data.event_log),
+                )
             return data
 
         except VestaAuthenticationError as err:
@@ -106,18 +206,95 @@ class VestaDataUpdateCoordinator(DataUpdateCoordinator[VestaData]):
             _LOGGER.exception("Unexpected error during update: %s", err)
             raise UpdateFailed(f"Unexpected error: {err}") from err
 
+    def device_info_for(self, device: DeviceStatus) -> DeviceInfo:
+        """Return the registry DeviceInfo for a device, building it once.
+
+        Args:
+            device: The device to describe.
+
+        Returns:
+            The shared DeviceInfo for this device.
+        """
+        info = self._device_infos.get(device.device_id)
+        if info is None:
+            entry_id = self.config_entry.entry_id
+            uid = entry_id + "_" + device.device_id
+            self.device_uids[device.device_id] = uid
+            info = DeviceInfo(
+                identifiers={(DOMAIN, uid)},
+                name=device.name,
+                manufacturer=MANUFACTURER,
+                model=DEVICE_TYPE_NAMES.get(device.type_f, device.type_f),
+                serial_number=device.device_id,
+                via_device=(DOMAIN, entry_id),
+            )
+            self._device_infos[device.device_id] = info
+        return info
+
+    def _interval_for(self, data: VestaData) -> int:
+        """Pick the polling interval for the current panel state.
+
+        Armed or triggered panels (and a short burst after a command) are
+        polled at the fast interval; a disarmed, idle panel returns
+        unchanged data on nearly every tick, so it relaxes to the slower
+        one.
+
+        Args:
+            data: The freshly fetched panel data.
+
+        Returns:
+            The next update interval in seconds.
+        """
+        if (
+            self._burst_ticks
+            or self.is_alarm_triggered
+            or data.panel.mode.casefold() != "disarm"
+        ):
+            return DEFAULT_SCAN_INTERVAL
+        return IDLE_SCAN_INTERVAL
+
     async def async_set_alarm_mode(self, mode: int, area: int = 1) -> bool:
         """Set the alarm mode and refresh data.
 
+        Identical commands issued while one is still in flight await the
+        existing request instead of hitting the panel again, so bursty
+        callers collapse to a single POST and refresh.
+
         Args:
             mode: The mode to set (0=Disarm, 1=Arm Away, 2=Arm Home).
             area: The area number. Default is 1.
 
+        Returns:
+            True if successful.
+        """
+        key = (mode, area)
+        inflight = self._inflight_set
+        if inflight is not None and inflight[0] == key and not inflight[1].done():
+            return await inflight[1]
+
+        task = self.hass.async_create_task(self._do_set_alarm_mode(mode, area))
+        self._inflight_set = (key, task)
+        try:
+            return await task
+        finally:
+            if self._inflight_set is not None and self._inflight_set[1] is task:
+                self._inflight_set = None
+
+    async def _do_set_alarm_mode(self, mode: int, area: int) -> bool:
+        """Send the mode command and refresh on success.
+
+        Args:
+            mode: The mode to set.
+            area: The area number.
+
         Returns:
             True if successful.
         """
         result = await self.client.set_alarm_mode(mode, area)
         if result:
-            # Refresh data immediately after mode change
+            # Poll fast for a few ticks so the panel's transition (exit
+            # delay, siren state) is reflected promptly, then refresh now;
+            # async_request_refresh is already debounced by the coordinator
+            self._burst_ticks = COMMAND_BURST_TICKS
             await self.async_request_refresh()
         return result
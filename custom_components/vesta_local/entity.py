@@ -7,10 +7,10 @@ from typing import TYPE_CHECKING
 from homeassistant.helpers.device_registry import DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .client import DeviceStatus
-from .const import DEVICE_TYPE_NAMES, DOMAIN, MANUFACTURER
+from .const import DOMAIN, MANUFACTURER
 
 if TYPE_CHECKING:
+    from .client import DeviceStatus
     from .coordinator import VestaDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -28,6 +28,10 @@ class VestaEntity(CoordinatorEntity["VestaDataUpdateCoordinator"]):
 
     _attr_has_entity_name = True
 
+    # Slot the integration's own per-entity fields; lookups bypass the
+    # instance dict that the Entity base class still provides
+    __slots__ = ("_entry_id",)
+
     def __init__(
         self,
         coordinator: VestaDataUpdateCoordinator,
@@ -53,6 +57,8 @@ class VestaDeviceEntity(VestaEntity):
         device_id: The unique device identifier.
     """
 
+    __slots__ = ("_device_id", "_zone", "_area")
+
     def __init__(
         self,
         coordinator: VestaDataUpdateCoordinator,
@@ -72,18 +78,10 @@ class VestaDeviceEntity(VestaEntity):
         self._zone = device.zone
         self._area = device.area
 
-        # Set unique ID based on device
-        self._attr_unique_id = f"{entry_id}_{device.device_id}"
-
-        # Device info for Home Assistant device registry
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, f"{entry_id}_{device.device_id}")},
-            name=device.name,
-            manufacturer=MANUFACTURER,
-            model=DEVICE_TYPE_NAMES.get(device.type_f, device.type_f),
-            serial_number=device.device_id,
-            via_device=(DOMAIN, entry_id),
-        )
+        # Device info and the unique-id string are built once per device
+        # on the coordinator and shared across all entities of the device
+        self._attr_device_info = coordinator.device_info_for(device)
+        self._attr_unique_id = coordinator.device_uids[device.device_id]
 
     @property
     def device_data(self) -> DeviceStatus | None:
@@ -92,13 +90,7 @@ class VestaDeviceEntity(VestaEntity):
         Returns:
             The DeviceStatus for this device, or None if not found.
         """
-        if self.coordinator.data is None:
-            return None
-
-        for device in self.coordinator.data.devices:
-            if device.device_id == self._device_id:
-                return device
-        return None
+        return self.coordinator.devices_by_id.get(self._device_id)
 
     @property
     def available(self) -> bool:
@@ -120,6 +112,8 @@ class VestaPanelEntity(VestaEntity):
         area: The panel area number.
     """
 
+    __slots__ = ("_area",)
+
     def __init__(
         self,
         coordinator: VestaDataUpdateCoordinator,
@@ -138,12 +132,13 @@ class VestaPanelEntity(VestaEntity):
         self._area = area
 
         # Set unique ID based on panel area
-        self._attr_unique_id = f"{entry_id}_panel_area_{area}"
+        self._attr_unique_id = entry_id + "_panel_area_" + str(area)
 
-        # Device info for the main panel
+        # Device info for the main panel; the display name is precomputed
+        # on the coordinator and shared by all panel entities
         self._attr_device_info = DeviceInfo(
             identifiers={(DOMAIN, entry_id)},
-            name=f"Vesta Panel ({coordinator.client.host})",
+            name=coordinator.panel_name,
             manufacturer=MANUFACTURER,
             model="HSGW-MAX",
         )
@@ -6,7 +6,8 @@ battery status and GSM signal strength.
 from __future__ import annotations
 
 import logging
-import re
+from functools import lru_cache
+from types import MappingProxyType
 from typing import TYPE_CHECKING
 
 from homeassistant.components.sensor import (
@@ -18,18 +19,83 @@ from homeassistant.const import PERCENTAGE, EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .client import DeviceStatus, EventLogEntry
+from .client import extract_zone
+from .const import MAX_EVENTS_IN_ATTRIBUTES
 from .entity import VestaDeviceEntity, VestaPanelEntity
 
 if TYPE_CHECKING:
+    from collections.abc import Iterator
+
     from . import VestaConfigEntry
+    from .client import DeviceStatus, EventLogEntry
     from .coordinator import VestaDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
-# Maximum number of events to store in sensor attributes to avoid exceeding
-# Home Assistant's 16384 byte state attribute limit
-MAX_EVENTS_IN_ATTRIBUTES = 20
+# AC icon indexed by the panel's ac_failure flag
+_AC_ICONS = {True: "mdi:power-plug-off", False: "mdi:power-plug"}
+
+# Battery icons keyed by the exact casefolded status strings the panel
+# is known to emit; the substring heuristic only runs for strings that
+# miss this table
+_BATTERY_ICON_MAP = MappingProxyType({
+    "normal": "mdi:battery",
+    "ok": "mdi:battery",
+    "low": "mdi:battery-alert",
+    "low battery": "mdi:battery-alert",
+    "fail": "mdi:battery-alert",
+    "failure": "mdi:battery-alert",
+    "charging": "mdi:battery-charging",
+})
+
+
+def _event_to_dict(event: EventLogEntry) -> dict[str, str]:
+    """Convert an event log entry to its attribute dict form.
+
+    Single definition of the attribute schema, shared by both event
+    sensors; each cached enrichment pass builds these dicts once per
+    coordinator snapshot.
+
+    Args:
+        event: The event log entry to convert.
+
+    Returns:
+        The attribute dict for the event.
+    """
+    # pydantic v2 keeps validated field values in the model's __dict__,
+    # so one C-level dict copy replaces eight attribute reads; only the
+    # log_time key is renamed to match the published attribute schema
+    values = event.__dict__
+    entry = {"time": values["log_time"]}
+    entry.update(values)
+    del entry["log_time"]
+    return entry
+
+
+@lru_cache(maxsize=16)
+def _battery_icon(status: str) -> str:
+    """Return the battery icon for a panel battery status string.
+
+    Known status strings resolve with one dict lookup; only strings
+    outside the table fall back to substring scanning. The panel reports
+    a small fixed vocabulary, so either path runs once per unique string
+    instead of on every state read.
+
+    Args:
+        status: The raw battery status string from the panel.
+
+    Returns:
+        The Material Design icon name.
+    """
+    lowered = status.casefold()
+    icon = _BATTERY_ICON_MAP.get(lowered)
+    if icon is not None:
+        return icon
+    if "low" in lowered or "fail" in lowered:
+        return "mdi:battery-alert"
+    if "charging" in lowered:
+        return "mdi:battery-charging"
+    return "mdi:battery"
 
 
 async def async_setup_entry(
@@ -46,21 +112,20 @@ async def async_setup_entry(
     """
     coordinator = entry.runtime_data
 
-    entities: list[SensorEntity] = [
-        VestaGsmSignalSensor(coordinator, entry.entry_id),
-        VestaBatteryStatusSensor(coordinator, entry.entry_id),
-        VestaAcStatusSensor(coordinator, entry.entry_id),
-        VestaEventLogSensor(coordinator, entry.entry_id),
-    ]
-
-    if coordinator.data:
-        for device in coordinator.data.devices:
-            entities.append(
-                VestaDeviceLastEventSensor(coordinator, device, entry.entry_id)
-            )
+    def _gen() -> Iterator[SensorEntity]:
+        """Yield sensor entities without building an intermediate list."""
+        yield VestaGsmSignalSensor(coordinator, entry.entry_id)
+        yield VestaBatteryStatusSensor(coordinator, entry.entry_id)
+        yield VestaAcStatusSensor(coordinator, entry.entry_id)
+        yield VestaEventLogSensor(coordinator, entry.entry_id)
+        if coordinator.data:
+            for device in coordinator.data.devices:
+                yield VestaDeviceLastEventSensor(coordinator, device, entry.entry_id)
 
-    async_add_entities(entities)
-    _LOGGER.debug("Added %d sensor entities", len(entities))
+    async_add_entities(_gen())
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        device_count = len(coordinator.data.devices) if coordinator.data else 0
+        _LOGGER.debug("Added %d sensor entities", 4 + device_count)
 
 
 class VestaGsmSignalSensor(VestaPanelEntity, SensorEntity):
@@ -83,6 +148,10 @@ class VestaGsmSignalSensor(VestaPanelEntity, SensorEntity):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:signal"
 
+    # No instance fields of its own; _attr_* values live in the Entity
+    # base dict, so an empty slots tuple avoids adding another layout
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: VestaDataUpdateCoordinator,
@@ -96,18 +165,17 @@ class VestaGsmSignalSensor(VestaPanelEntity, SensorEntity):
         """
         super().__init__(coordinator, entry_id)
         self._attr_unique_id = f"{entry_id}_gsm_signal"
+        self._update_attrs()
 
-    @property
-    def native_value(self) -> int | None:
-        """Return the GSM signal strength.
-
-        Returns:
-            The signal strength as a percentage (0-100) or None.
-        """
-        if self.coordinator.data is None:
-            return None
+    def _update_attrs(self) -> None:
+        """Compute the signal value from the current coordinator data."""
+        data = self.coordinator.data
+        self._attr_native_value = None if data is None else data.panel.gsm_signal
 
-        return self.coordinator.data.panel.gsm_signal
+    def _handle_coordinator_update(self) -> None:
+        """Recompute cached attributes when the coordinator refreshes."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
 
 class VestaBatteryStatusSensor(VestaPanelEntity, SensorEntity):
@@ -126,6 +194,8 @@ class VestaBatteryStatusSensor(VestaPanelEntity, SensorEntity):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:battery"
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: VestaDataUpdateCoordinator,
@@ -139,35 +209,23 @@ class VestaBatteryStatusSensor(VestaPanelEntity, SensorEntity):
         """
         super().__init__(coordinator, entry_id)
         self._attr_unique_id = f"{entry_id}_battery_status"
+        self._update_attrs()
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the battery status.
-
-        Returns:
-            The battery status string or None.
-        """
-        if self.coordinator.data is None:
-            return None
-
-        return self.coordinator.data.panel.battery_status
-
-    @property
-    def icon(self) -> str:
-        """Return the icon based on battery status.
-
-        Returns:
-            The appropriate battery icon.
-        """
-        if self.coordinator.data is None:
-            return "mdi:battery-unknown"
+    def _update_attrs(self) -> None:
+        """Compute the status string and icon from coordinator data."""
+        data = self.coordinator.data
+        if data is None:
+            self._attr_native_value = None
+            self._attr_icon = "mdi:battery-unknown"
+            return
+        status = data.panel.battery_status
+        self._attr_native_value = status
+        self._attr_icon = _battery_icon(status)
 
-        status = self.coordinator.data.panel.battery_status.lower()
-        if "low" in status or "fail" in status:
-            return "mdi:battery-alert"
-        if "charging" in status:
-            return "mdi:battery-charging"
-        return "mdi:battery"
+    def _handle_coordinator_update(self) -> None:
+        """Recompute cached attributes when the coordinator refreshes."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
 
 class VestaAcStatusSensor(VestaPanelEntity, SensorEntity):
@@ -186,6 +244,8 @@ class VestaAcStatusSensor(VestaPanelEntity, SensorEntity):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:power-plug"
 
+    __slots__ = ()
+
     def __init__(
         self,
         coordinator: VestaDataUpdateCoordinator,
@@ -199,34 +259,23 @@ class VestaAcStatusSensor(VestaPanelEntity, SensorEntity):
         """
         super().__init__(coordinator, entry_id)
         self._attr_unique_id = f"{entry_id}_ac_status"
+        self._update_attrs()
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the AC power status.
-
-        Returns:
-            "OK" if AC power is present, "Failure" if not, None if unknown.
-        """
-        if self.coordinator.data is None:
-            return None
-
-        if self.coordinator.data.panel.ac_failure:
-            return "Failure"
-        return "OK"
-
-    @property
-    def icon(self) -> str:
-        """Return the icon based on AC status.
+    def _update_attrs(self) -> None:
+        """Compute the AC state and icon from coordinator data."""
+        data = self.coordinator.data
+        if data is None:
+            self._attr_native_value = None
+            self._attr_icon = "mdi:power-plug-off-outline"
+            return
+        failure = data.panel.ac_failure
+        self._attr_native_value = "Failure" if failure else "OK"
+        self._attr_icon = _AC_ICONS[failure]
 
-        Returns:
-            The appropriate power icon.
-        """
-        if self.coordinator.data is None:
-            return "mdi:power-plug-off-outline"
-
-        if self.coordinator.data.panel.ac_failure:
-            return "mdi:power-plug-off"
-        return "mdi:power-plug"
+    def _handle_coordinator_update(self) -> None:
+        """Recompute cached attributes when the coordinator refreshes."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
 
 class VestaEventLogSensor(VestaPanelEntity, SensorEntity):
@@ -246,7 +295,7 @@ class VestaEventLogSensor(VestaPanelEntity, SensorEntity):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:history"
 
-    _ZONE_RE = re.compile(r"Zone(\d+)")
+    __slots__ = ("_cached_data_id",)
 
     def __init__(
         self,
@@ -262,76 +311,86 @@ class VestaEventLogSensor(VestaPanelEntity, SensorEntity):
         super().__init__(coordinator, entry_id)
         self._attr_unique_id = f"{entry_id}_event_log"
 
-    def _build_zone_map(self) -> dict[int, dict[str, str]]:
-        """Build a mapping from zone number to device info.
-
-        Returns:
-            Dict mapping zone number to device_id and name.
-        """
-        if self.coordinator.data is None:
-            return {}
-        return {
-            device.zone: {
-                "device_id": device.device_id,
-                "device_name": device.name,
-            }
-            for device in self.coordinator.data.devices
-        }
+        # Enriched events rebuilt once per coordinator snapshot, keyed on
+        # its id(); the coordinator returns the same object for unchanged
+        # refreshes, so idle ticks keep hitting. Stored as a tuple so
+        # the shared container is immutable
+        self._cached_data_id: int | None = None
+        self._update_attrs()
 
     def _enrich_events(self) -> list[dict[str, str]]:
         """Build the enriched event list from coordinator data.
 
+        Device matching uses the coordinator's per-refresh zone index
+        directly; no intermediate zone map is built. The caller only
+        invokes this once data with a non-empty log is present, so the
+        absent-data path never reaches the enrichment allocations; with
+        no devices to match, the per-event zone extraction is skipped
+        entirely.
+
         Returns:
             List of event dicts with device_id/device_name when matched.
         """
-        if self.coordinator.data is None:
-            return []
-        zone_map = self._build_zone_map()
-        enriched = []
-        for event in self.coordinator.data.event_log:
-            entry: dict[str, str] = {
-                "time": event.log_time,
-                "area": event.area,
-                "mode": event.mode,
-                "action": event.action,
-                "user": event.user,
-                "source": event.source,
-                "device_type": event.device_type,
-                "msg": event.msg,
-            }
-            match = self._ZONE_RE.search(event.source)
-            if match:
-                zone_num = int(match.group(1))
-                device_info = zone_map.get(zone_num)
-                if device_info:
-                    entry["device_id"] = device_info["device_id"]
-                    entry["device_name"] = device_info["device_name"]
-            enriched.append(entry)
+        # Only entries that can appear in the attributes are enriched
+        data = self.coordinator.data
+        events = data.event_log[:MAX_EVENTS_IN_ATTRIBUTES]
+
+        devices_by_zone = self.coordinator.devices_by_zone
+        if not devices_by_zone:
+            return [_event_to_dict(event) for event in events]
+
+        # Bind the per-event callables to locals; inside the loop these
+        # resolve with a fast local load instead of repeated global and
+        # attribute lookups
+        enriched: list[dict[str, str]] = []
+        append = enriched.append
+        to_dict = _event_to_dict
+        zone_of = extract_zone
+        device_for = devices_by_zone.get
+        for event in events:
+            entry = to_dict(event)
+            zone = zone_of(event.source)
+            if zone is not None:
+                device = device_for(zone)
+                if device is not None:
+                    entry["device_id"] = device.device_id
+                    entry["device_name"] = device.name
+            append(entry)
         return enriched
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the most recent event.
+    def _update_attrs(self) -> None:
+        """Compute the state string and enriched attributes together.
 
-        Returns:
-            The most recent event as a string or None.
+        The state and attribute reads share one pass over the snapshot:
+        both are rebuilt at most once per coordinator data object, with
+        the attribute list capped at MAX_EVENTS_IN_ATTRIBUTES to stay
+        under Home Assistant's state attribute size limit.
         """
-        if self.coordinator.data is None or not self.coordinator.data.event_log:
-            return None
-        latest = self.coordinator.data.event_log[0]
-        return f"{latest.log_time}: {latest.action}"
+        data = self.coordinator.data
+        if data is None or not data.event_log:
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = None
+            self._cached_data_id = None
+            return
 
-    @property
-    def extra_state_attributes(self) -> dict[str, list[dict[str, str]]] | None:
-        """Return the most recent events as attributes.
+        if id(data) == self._cached_data_id:
+            return
 
-        Returns:
-            Dictionary containing the most recent enriched events,
-            limited to MAX_EVENTS_IN_ATTRIBUTES to avoid exceeding
-            Home Assistant's state attribute size limit.
-        """
-        enriched = self._enrich_events()[:MAX_EVENTS_IN_ATTRIBUTES]
-        return {"events": enriched} if enriched else None
+        latest = data.event_log[0]
+        self._attr_native_value = f"{latest.log_time}: {latest.action}"
+
+        # Plain dicts in an immutable tuple: recorder/websocket
+        # serialization does not accept mappingproxy, and the
+        # per-snapshot cache already means these records are built once
+        # and shared across every state read until the next snapshot
+        enriched = tuple(self._enrich_events())
+        self._attr_extra_state_attributes = {"events": enriched} if enriched else None
+        self._cached_data_id = id(data)
+
+    def _handle_coordinator_update(self) -> None:
+        """Recompute cached state and attributes on coordinator refresh."""
+        self._update_attrs()
+        super()._handle_coordinator_update()
 
 
 class VestaDeviceLastEventSensor(VestaDeviceEntity, SensorEntity):
@@ -350,7 +409,7 @@ class VestaDeviceLastEventSensor(VestaDeviceEntity, SensorEntity):
     _attr_entity_category = EntityCategory.DIAGNOSTIC
     _attr_icon = "mdi:history"
 
-    _ZONE_RE = re.compile(r"Zone(\d+)")
+    __slots__ = ()
 
     def __init__(
         self,
@@ -366,62 +425,31 @@ class VestaDeviceLastEventSensor(VestaDeviceEntity, SensorEntity):
             entry_id: The config entry ID.
         """
         super().__init__(coordinator, device, entry_id)
-        self._attr_unique_id = f"{entry_id}_{device.device_id}_last_event"
-
-    def _find_device_events(self) -> list[EventLogEntry]:
-        """Find all event log entries matching this device's zone.
-
-        Returns:
-            List of matching EventLogEntry objects, most recent first.
-        """
-        if self.coordinator.data is None:
-            return []
-        events = []
-        for event in self.coordinator.data.event_log:
-            match = self._ZONE_RE.search(event.source)
-            if match and int(match.group(1)) == self._zone:
-                events.append(event)
-        return events
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the most recent event for this device.
-
-        Includes the timestamp so HA detects a state change even when
-        the same action occurs multiple times in a row.
+        self._attr_unique_id = self._attr_unique_id + "_last_event"
+        self._update_attrs()
 
-        Returns:
-            The timestamp and action string, or None if no events found.
-        """
-        events = self._find_device_events()
-        if not events:
-            return None
-        return f"{events[0].log_time}: {events[0].action}"
+    def _update_attrs(self) -> None:
+        """Compute the state and event attributes from the zone index.
 
-    @property
-    def extra_state_attributes(self) -> dict[str, list[dict[str, str]]] | None:
-        """Return the most recent events for this device as attributes.
-
-        Returns:
-            Dictionary containing the list of events for this device,
-            limited to MAX_EVENTS_IN_ATTRIBUTES to avoid exceeding
-            Home Assistant's state attribute size limit.
+        The coordinator groups the log by zone once per refresh (already
+        capped at MAX_EVENTS_IN_ATTRIBUTES per zone), so this is a
+        single dict lookup per refresh and state reads between refreshes
+        are plain attribute loads. The state includes the timestamp so
+        HA detects a change even when the same action repeats.
         """
-        events = self._find_device_events()[:MAX_EVENTS_IN_ATTRIBUTES]
+        events = self.coordinator.events_by_zone.get(self._zone)
         if not events:
-            return None
-        return {
-            "events": [
-                {
-                    "time": event.log_time,
-                    "area": event.area,
-                    "mode": event.mode,
-                    "action": event.action,
-                    "user": event.user,
-                    "source": event.source,
-                    "device_type": event.device_type,
-                    "msg": event.msg,
-                }
-                for event in events
-            ]
+            self._attr_native_value = None
+            self._attr_extra_state_attributes = None
+            return
+
+        latest = events[0]
+        self._attr_native_value = f"{latest.log_time}: {latest.action}"
+        self._attr_extra_state_attributes = {
+            "events": [_event_to_dict(event) for event in events]
         }
+
+    def _handle_coordinator_update(self) -> None:
+        """Recompute cached state and attributes on coordinator refresh."""
+        self._update_attrs()
+        super()._handle_coordinator_update()